@@ -1,7 +1,16 @@
+import re
+
 from setuptools import setup, find_packages
 
-import untappd
-version = str(untappd.__version__)
+# Read the version without importing the package and its dependencies
+with open('./untappd/_version.py', 'r') as version_file:
+    version = re.search(r"__version__\s*=\s*['\"]([^'\"]+)", version_file.read()).group(1)
+
+try:
+    with open('./README.txt', 'r') as readme_file:
+        long_description = readme_file.read()
+except IOError:
+    long_description = ''
 
 setup(
     name='untappd',
@@ -10,7 +19,7 @@ setup(
     author_email='christopherwilliambetz@gmail.com',
     url='https://github.com/cbetz/untappd-python',
     description='Untappd wrapper library',
-    long_description=open('./README.txt', 'r').read(),
+    long_description=long_description,
     download_url='https://github.com/cbetz/untappd-python/tarball/master',
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -26,6 +35,11 @@ setup(
         'requests',
         'future',
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'http2': ['httpx[http2]'],
+    },
     license='MIT License',
     keywords='untappd api',
     include_package_data=True,
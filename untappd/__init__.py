@@ -4,7 +4,8 @@
 from __future__ import unicode_literals
 from builtins import str
 import logging
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 # Uncomment the line below to show debug logging in console
 # logging.basicConfig(level=logging.DEBUG)
 
@@ -13,11 +14,24 @@ try:
 except ImportError:
     import urllib
 
-import inspect
+try:
+    # orjson and ujson parse bytes directly and are much faster on large responses
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+from collections import OrderedDict
+import copy
+import random
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 
-__version__ = 0.5
+from ._version import __version__
 __author__ = 'Christopher Betz'
 
 AUTH_URL = 'https://untappd.com/oauth/authenticate/'
@@ -26,55 +40,106 @@ API_URL_BASE = 'https://api.untappd.com/v4'
 
 # Number of times to try http requests
 NUM_REQUEST_TRIES = 3
+# Exponential backoff bounds (in seconds) between tries
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+# Seconds to wait for a connection and for response data; the connect timeout
+# sits just above a multiple of the 3 second TCP retransmission window
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 27
+
+# Default number of requests bulk calls keep in flight, matching the connection pool size
+BULK_MAX_WORKERS = 10
+
+# Consecutive failed tries after which requests fail fast, and for how many seconds
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 30.0
+
+# Maximum number of GET responses kept when response caching is enabled
+CACHE_MAX_SIZE = 256
+
+# Codes can only be exchanged once, so remember the tokens they were exchanged for
+TOKEN_CACHE_MAX_SIZE = 1024
+TOKEN_CACHE_TTL = 3600
+
+# Transports the synchronous client can use
+TRANSPORT_HTTP1 = 'http1'
+TRANSPORT_HTTP2 = 'http2'
 
 # Generic untappd exception
 class UntappdException(Exception): pass
 # Specific exceptions
 class InvalidAuth(UntappdException): pass
+class UntappdParseError(UntappdException): pass
+class ResponseFormatError(UntappdException): pass
+class CircuitOpenError(UntappdException): pass
 
 ERROR_TYPES = {
     'invalid_auth': InvalidAuth
 }
 
+# Meta codes of responses that carry usable data, see: https://untappd.com/api/docs/v4
+SUCCESS_CODES = frozenset((200, 409))
+
+# Errors that would just happen again if the request was retried
+NON_RETRIABLE_ERRORS = (InvalidAuth, UntappdParseError, ResponseFormatError, CircuitOpenError)
+
 class Untappd(object):
     """Untappd V4 API client"""
-    def __init__(self, client_id=None, client_secret=None, access_token=None, redirect_url=None, user_agent=None):
-        """Sets up the API client object"""
+    def __init__(self, client_id=None, client_secret=None, access_token=None, redirect_url=None, user_agent=None, cache_ttl=0, transport=TRANSPORT_HTTP1,
+                 request_tries=NUM_REQUEST_TRIES, retry_base_delay=RETRY_BASE_DELAY, retry_max_delay=RETRY_MAX_DELAY,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT):
+        """Sets up the API client object
+
+        cache_ttl is the number of seconds GET responses are reused for, 0 disables caching
+        transport selects requests over HTTP/1.1 ('http1') or httpx over HTTP/2 ('http2')
+        request_tries is how many times a request is tried, with a jittered exponential
+        backoff between retry_base_delay and retry_max_delay seconds between tries
+        connect_timeout and read_timeout are the seconds a try waits for a connection and for data
+        """
         # Either client_id and client_secret or access_token is required to access the API
         if (not client_id or not client_secret) and not access_token:
             error_message = 'You must specify a client_id and client_secret or an access_token'
-            logging.error(error_message)
+            _log.error(error_message)
             raise UntappdException(error_message)
         # Set up requester
-        self.requester = self.Requester(client_id, client_secret, access_token, user_agent)
+        self.requester = self.Requester(
+            client_id, client_secret, access_token, user_agent, cache_ttl, transport,
+            request_tries, retry_base_delay, retry_max_delay, connect_timeout, read_timeout,
+        )
         # Set up OAuth
         self.oauth = self.OAuth(self.requester, client_id, client_secret, redirect_url)
         # Dynamically enable endpoints
         self._attach_endpoints()
 
+    def __del__(self):
+        """Releases pooled connections when the client goes away"""
+        requester = getattr(self, 'requester', None)
+        if requester is not None:
+            requester.close()
+
     def _attach_endpoints(self):
-        """Dynamically attaches endpoint callables to this client"""
-        for name, value in inspect.getmembers(self):
-            if inspect.isclass(value) and issubclass(value, self._Endpoint) and (value is not self._Endpoint):
-                endpoint_instance = value(self.requester)
-                setattr(self, endpoint_instance.endpoint_base, endpoint_instance)
-                if not hasattr(endpoint_instance, 'get_endpoints'):
-                    endpoint_instance.get_endpoints = ()
-                if not hasattr(endpoint_instance, 'post_endpoints'):
-                    endpoint_instance.post_endpoints = ()
-                if not hasattr(endpoint_instance, 'is_callable'):
-                    endpoint_instance.is_callable = False
-                for endpoint in (endpoint_instance.get_endpoints + endpoint_instance.post_endpoints):
-                    function = endpoint_instance.create_endpoint_function(endpoint)
-                    function_name = endpoint.replace('/', '_')
-                    setattr(endpoint_instance, function_name, function)
-                    function.__name__ = str(function_name)
-                    function.__doc__ = 'Tells the object to make a request to the {0} endpoint'.format(endpoint)
+        """Dynamically attaches endpoint objects to this client"""
+        for endpoint_class in self._ENDPOINT_CLASSES:
+            setattr(self, endpoint_class.endpoint_base, endpoint_class(self.requester))
 
     def set_access_token(self, access_token):
         """Updates the access token to use"""
         self.requester.set_access_token(access_token)
 
+    def cache_clear(self):
+        """Empties the GET response cache"""
+        self.requester.cache_clear()
+
+    def bulk(self, calls, max_workers=BULK_MAX_WORKERS):
+        """Makes several endpoint requests concurrently
+
+        calls is an iterable of (endpoint_function, kwargs) pairs, e.g.
+        [(client.beer.info, {'id': 1}), (client.venue.info, {'id': 2})].
+        Results are returned in the same order as the calls.
+        """
+        return self.requester.bulk(calls, max_workers)
+
     class OAuth(object):
         """Handles OAuth authentication procedures and helps retrieve tokens"""
         def __init__(self, requester, client_id, client_secret, redirect_url):
@@ -82,6 +147,8 @@ class Untappd(object):
             self.client_id = client_id
             self.client_secret = client_secret
             self.redirect_url = redirect_url
+            self._tokens = OrderedDict()
+            self._tokens_lock = threading.Lock()
 
         def get_auth_url(self):
             """Gets the URL a user needs to access to get an access token"""
@@ -96,8 +163,11 @@ class Untappd(object):
             """Gets the access token from a user's response"""
             if not code:
                 error_message = 'Code not provided'
-                logging.error(error_message)
+                _log.error(error_message)
                 raise UntappdException(error_message)
+            access_token = self._get_cached_token(code)
+            if access_token is not None:
+                return access_token
             payload = {
                 'client_id': self.client_id,
                 'client_secret': self.client_secret,
@@ -106,100 +176,375 @@ class Untappd(object):
                 'code': str(code),
             }
             # Get the response from the token uri and attempt to parse
-            data = self.requester.request(TOKEN_URL, payload=payload, enrich_payload=False)
-            return data.get('response').get('access_token')
+            data = self.requester.request(TOKEN_URL, payload=payload, enrich_payload=False, cacheable=False)
+            access_token = data.get('response').get('access_token')
+            self._cache_token(code, access_token)
+            return access_token
+
+        def _get_cached_token(self, code):
+            """Gets the access token a code was recently exchanged for"""
+            with self._tokens_lock:
+                entry = self._tokens.get(str(code))
+                if entry is None:
+                    return None
+                expires, access_token = entry
+                if expires < time.monotonic():
+                    del self._tokens[str(code)]
+                    return None
+            _log.debug('Reusing the access token already retrieved for this code')
+            return access_token
+
+        def _cache_token(self, code, access_token):
+            """Remembers the access token a code was exchanged for"""
+            if not access_token:
+                return
+            with self._tokens_lock:
+                self._tokens[str(code)] = (time.monotonic() + TOKEN_CACHE_TTL, access_token)
+                if len(self._tokens) > TOKEN_CACHE_MAX_SIZE:
+                    self._tokens.popitem(last=False)
 
     class Requester(object):
         """API requesting object"""
-        def __init__(self, client_id=None, client_secret=None, access_token=None, user_agent=None):
+        def __init__(self, client_id=None, client_secret=None, access_token=None, user_agent=None, cache_ttl=0, transport=TRANSPORT_HTTP1,
+                     request_tries=NUM_REQUEST_TRIES, retry_base_delay=RETRY_BASE_DELAY, retry_max_delay=RETRY_MAX_DELAY,
+                     connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT):
             """Sets up the API requesting object"""
+            self._init_retries(request_tries, retry_base_delay, retry_max_delay)
+            self.connect_timeout = connect_timeout
+            self.read_timeout = read_timeout
             self.client_id = client_id
             self.client_secret = client_secret
             self.headers =  requests.utils.default_headers()
             if user_agent:
                 self.headers.update({'User-Agent': user_agent})
+            # Reuse keep-alive connections to the API across requests
+            if transport == TRANSPORT_HTTP1:
+                self._setup_http1_session()
+            elif transport == TRANSPORT_HTTP2:
+                self._setup_http2_session()
+            else:
+                error_message = 'Unknown transport: {0}'.format(transport)
+                _log.error(error_message)
+                raise UntappdException(error_message)
+            self._init_cache(cache_ttl)
+            self._init_circuit()
             self.set_access_token(access_token)
 
+        def _init_retries(self, request_tries, retry_base_delay, retry_max_delay):
+            """Sets up how failed requests are retried"""
+            if request_tries < 1:
+                error_message = 'request_tries must be at least 1'
+                _log.error(error_message)
+                raise UntappdException(error_message)
+            self.request_tries = request_tries
+            self.retry_base_delay = retry_base_delay
+            self.retry_max_delay = retry_max_delay
+
+        def _init_circuit(self):
+            """Sets up the circuit breaker that fails fast while the API is down"""
+            self._circuit_lock = threading.Lock()
+            self._circuit_failures = 0
+            self._circuit_opened_at = None
+
+        def _check_circuit(self):
+            """Raises if the circuit is open, letting one probe request through after the cooldown"""
+            with self._circuit_lock:
+                if self._circuit_opened_at is None:
+                    return
+                if time.monotonic() - self._circuit_opened_at < CIRCUIT_COOLDOWN:
+                    raise CircuitOpenError('Untappd API unavailable, not sending requests for a while')
+                # Half open: this request probes the API, the rest keep failing fast until it's done
+                self._circuit_opened_at = time.monotonic()
+
+        def _record_circuit(self, error=None):
+            """Updates the circuit breaker with the outcome of a try"""
+            if isinstance(error, CircuitOpenError):
+                return
+            with self._circuit_lock:
+                if error is None or not getattr(error, 'transient', False):
+                    # The API answered, even if it didn't like the request
+                    self._circuit_failures = 0
+                    self._circuit_opened_at = None
+                    return
+                self._circuit_failures += 1
+                if self._circuit_opened_at is not None or self._circuit_failures >= CIRCUIT_FAILURE_THRESHOLD:
+                    _log.warning('Untappd API circuit opened after %s failed tries', self._circuit_failures)
+                    self._circuit_opened_at = time.monotonic()
+
+        def _init_cache(self, cache_ttl):
+            """Sets up the GET response cache"""
+            self.cache_ttl = cache_ttl
+            self._cache = OrderedDict()
+            self._cache_lock = threading.Lock()
+
+        def cache_clear(self, url_prefix=None):
+            """Empties the GET response cache, or just the entries for URLs under url_prefix"""
+            with self._cache_lock:
+                if url_prefix is None:
+                    self._cache.clear()
+                    return
+                for key in list(self._cache):
+                    url = key[0]
+                    if url.startswith(url_prefix) and url[len(url_prefix):][:1] in ('', '/', '?'):
+                        del self._cache[key]
+
+        def _cache_key(self, url, http_method, payload, cacheable=True):
+            """Gets the cache key for a request, None if it shouldn't be cached"""
+            if self.cache_ttl <= 0 or http_method != 'GET' or not cacheable:
+                return None
+            # The url holds the credentials, so users never share entries
+            return (url, tuple(sorted(payload.items())))
+
+        def _cache_get(self, key):
+            """Gets a cached response that hasn't expired yet"""
+            if key is None:
+                return None
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is None:
+                    return None
+                expires, data = entry
+                if expires < time.monotonic():
+                    del self._cache[key]
+                    return None
+            # Copies keep callers that modify a response from changing the cached one
+            return copy.deepcopy(data)
+
+        def _cache_set(self, key, data):
+            """Caches a response, evicting the oldest one when full"""
+            if key is None:
+                return
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic() + self.cache_ttl, copy.deepcopy(data))
+                self._cache.move_to_end(key)
+                if len(self._cache) > CACHE_MAX_SIZE:
+                    self._cache.popitem(last=False)
+
+        def _setup_http1_session(self):
+            """Sets up a pooled requests session"""
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            # Retries are left to the loop in request(), urllib3 retrying too would multiply the tries
+            self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=0))
+            self._timeout = (self.connect_timeout, self.read_timeout)
+            self._connection_errors = requests.exceptions.RequestException
+
+        def _setup_http2_session(self):
+            """Sets up an httpx client multiplexing requests over HTTP/2"""
+            # Optional and slow to import, so only loaded when this transport is used
+            try:
+                import httpx
+            except ImportError:
+                error_message = 'The http2 transport requires httpx, install untappd[http2]'
+                _log.error(error_message)
+                raise UntappdException(error_message)
+            # Like the requests adapter, retries are left to the loop in request()
+            http_transport = httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+            self.session = httpx.Client(transport=http_transport, headers=dict(self.headers))
+            self._timeout = httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+            self._connection_errors = httpx.HTTPError
+
+        def close(self):
+            """Closes the underlying HTTP session"""
+            self.session.close()
+
         def set_access_token(self, access_token):
             """Sets the OAuth access token for this requester"""
             self.access_token = access_token
             self.userless = not bool(access_token) # Userless if no access_token
-
-        def _enrich_payload(self, payload):
-            """Enriches the payload dict"""
+            # Credentials only change here, so build them once rather than per request
             if self.userless:
-                payload['client_id'] = self.client_id
-                payload['client_secret'] = self.client_secret
+                auth_params = {'client_id': self.client_id, 'client_secret': self.client_secret}
             else:
-                payload['access_token'] = self.access_token
-            return payload
-
-        def request(self, url, http_method='GET', payload={}, enrich_payload=True):
+                auth_params = {'access_token': access_token}
+            # Skip None values like requests does, so GETs and POSTs send the same credentials
+            self._auth_params = {key: value for key, value in auth_params.items() if value is not None}
+            self._auth_query = urllib.urlencode(self._auth_params)
+
+        def _add_credentials(self, url, http_method, payload):
+            """Adds the credentials to a request, returning the new url and payload"""
+            if http_method == 'GET':
+                # Reuse the pre-encoded credentials and only encode the per-call params,
+                # skipping None values like requests does
+                query = self._auth_query
+                params = [(key, value) for key, value in payload.items() if value is not None]
+                if params:
+                    encoded = urllib.urlencode(params, doseq=True)
+                    query = f'{query}&{encoded}' if query else encoded
+                return (f'{url}?{query}' if query else url), {}
+            return url, dict(payload, **self._auth_params)
+
+        def request(self, url, http_method='GET', payload=None, enrich_payload=True, cacheable=True):
             """Tries to load data from an endpoint using retries"""
-            if enrich_payload:
-                payload = self._enrich_payload(payload)
-            logging.debug('{http_method} url: {url} payload:{payload}'.format(
-                http_method=http_method,
-                url=url,
-                payload='* {0}'.format(payload) if payload else ''
-            ))
-            try_number = 1
-            while try_number <= NUM_REQUEST_TRIES:
+            url, payload, cache_key = self._prepare_request(url, http_method, payload, enrich_payload, cacheable)
+            data = self._cache_get(cache_key)
+            if data is not None:
+                return data
+            for try_number in range(1, self.request_tries + 1):
                 try:
-                    return self._process_request(url, http_method, payload)
+                    self._check_circuit()
+                    data = self._process_request(url, http_method, payload)
                 except UntappdException as e:
-                    # Some errors don't bear repeating
-                    if e.__class__ in [InvalidAuth]:
-                        raise
-                    if (try_number == NUM_REQUEST_TRIES):
-                        raise
-                    try_number += 1
-                time.sleep(1)
+                    time.sleep(self._failed_try(try_number, e))
+                else:
+                    return self._successful_try(cache_key, data)
+
+        def _prepare_request(self, url, http_method, payload, enrich_payload, cacheable):
+            """Gets the final url, payload and cache key of a request"""
+            if payload is None:
+                payload = {}
+            if enrich_payload:
+                url, payload = self._add_credentials(url, http_method, payload)
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug('%s url: %s payload: %s', http_method, url, payload)
+            return url, payload, self._cache_key(url, http_method, payload, cacheable)
+
+        def _successful_try(self, cache_key, data):
+            """Records a successful try and returns its data"""
+            self._record_circuit()
+            self._cache_set(cache_key, data)
+            return data
+
+        def _failed_try(self, try_number, error):
+            """Records a failed try, re-raising its error unless it is worth retrying after the returned delay"""
+            self._record_circuit(error)
+            # Some errors don't bear repeating
+            if isinstance(error, NON_RETRIABLE_ERRORS) or try_number >= self.request_tries:
+                raise error
+            return self._retry_delay(try_number, error)
+
+        def bulk(self, calls, max_workers=BULK_MAX_WORKERS):
+            """Runs (function, kwargs) pairs on a thread pool sharing this requester's session"""
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(function, **kwargs) for function, kwargs in calls]
+                return [future.result() for future in futures]
+
+        def _retry_delay(self, try_number, error):
+            """Seconds to wait before the next try, honoring a server Retry-After"""
+            retry_after = getattr(error, 'retry_after', None)
+            if retry_after is not None:
+                if retry_after > self.retry_max_delay:
+                    # Waiting that long would block the caller, let them decide when to come back
+                    raise error
+                return retry_after
+            # Full jitter keeps clients from retrying in lockstep
+            return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * (2 ** (try_number - 1))))
+
+        def _transient_error(self, error, status_code, headers):
+            """Marks an error from a rate limited or unavailable response as worth retrying"""
+            if status_code != 429 and status_code < 500:
+                return error
+            if isinstance(error, (UntappdParseError, ResponseFormatError)):
+                # An error page from the server or a proxy in front of it, not an API response
+                error = UntappdException('Untappd API unavailable, HTTP status {0}'.format(status_code))
+            error.retry_after = self._parse_retry_after(headers)
+            # Counts towards opening the circuit, unlike errors the API answered with
+            error.transient = True
+            return error
+
+        def _connection_error(self):
+            """Builds the error raised when the API couldn't be reached or timed out"""
+            error = UntappdException('Error connecting with Untappd API')
+            error.transient = True
+            return error
+
+        def _parse_retry_after(self, headers):
+            """Gets the Retry-After delay in seconds from response headers"""
+            value = headers.get('Retry-After')
+            if not value:
+                return None
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                import email.utils
+                date = email.utils.parsedate_tz(value)
+                if date is None:
+                    return None
+                return max(0.0, email.utils.mktime_tz(date) - time.time())
 
         def _process_request(self, url, http_method, payload):
             """Makes the request and handles exception processing"""
+            if getattr(self.session, 'is_closed', False):
+                # Unlike requests sessions, httpx clients can't send once closed, e.g. by Untappd.__del__
+                self._setup_http2_session()
             try:
                 if http_method == 'GET':
-                    response = requests.get(url, headers=self.headers, params=payload)
+                    response = self.session.get(url, params=payload or None, timeout=self._timeout)
                 elif http_method == 'POST':
-                    response = requests.post(url, headers=self.headers, data=payload)
+                    response = self.session.post(url, data=payload, timeout=self._timeout)
+            except self._connection_errors as e:
+                _log.error(e)
+                raise self._connection_error()
+            try:
                 data = self._decode_json_response(response)
                 if response.status_code == requests.codes.ok:
                     return data
                 return self._check_response(data)
-            except requests.exceptions.RequestException as e:
-                logging.error(e)
-                raise UntappdException('Error connecting with Untappd API')
+            except UntappdException as e:
+                raise self._transient_error(e, response.status_code, response.headers)
 
         def _decode_json_response(self, response):
             """Decodes a json response"""
             try:
-                return response.json()
+                return json_loads(response.content)
             except ValueError as e:
-                logging.error('Invalid response: {0}'.format(e))
-                raise UntappdException(e)
+                _log.error('Invalid response: %s', e)
+                raise UntappdParseError(e)
 
         def _check_response(self, data):
             """Processes the response data"""
             # Check the meta-data for why this request failed
-            meta = data.get('meta')
-            if meta:
-                # see: https://untappd.com/api/docs/v4
-                if meta.get('code') in (200, 409):
-                    return data
-                exc = ERROR_TYPES.get(meta.get('error_type'))
-                if exc:
-                    raise exc(meta.get('error_detail'))
-                else:
-                    logging.error('Unknown error type: {0}'.format(meta.get('error_type')))
-                    raise UntappdException(meta.get('error_detail'))
-            else:
+            meta = data.get('meta') if isinstance(data, dict) else None
+            if not meta or not isinstance(meta, dict):
                 error_message = 'Response format invalid, missing meta property'
-                logging.error(error_message)
-                raise UntappdException(error_message)
+                _log.error(error_message)
+                raise ResponseFormatError(error_message)
+            if meta.get('code') in SUCCESS_CODES:
+                return data
+            error_type = meta.get('error_type')
+            error_detail = meta.get('error_detail')
+            exc = ERROR_TYPES.get(error_type)
+            if exc:
+                raise exc(error_detail)
+            _log.error('Unknown error type: %s', error_type)
+            raise UntappdException(error_detail)
 
     class _Endpoint(object):
         """Generic endpoint class"""
+        get_endpoints = ()
+        post_endpoints = ()
+        # GET endpoints with side effects, never served from the response cache
+        uncached_endpoints = ()
+        is_callable = False
+
+        def __init_subclass__(cls, **kwargs):
+            """Creates the endpoint methods once, when the endpoint class is defined"""
+            super().__init_subclass__(**kwargs)
+            # The API base and endpoint base never change, so join them up front
+            cls._url_prefix = '{0}/{1}'.format(API_URL_BASE, cls.endpoint_base)
+            for endpoint in cls.__dict__.get('get_endpoints', ()):
+                cls._attach_endpoint_method(endpoint, 'GET')
+            for endpoint in cls.__dict__.get('post_endpoints', ()):
+                cls._attach_endpoint_method(endpoint, 'POST')
+
+        @classmethod
+        def _attach_endpoint_method(cls, endpoint, http_method):
+            """Adds a method to tell the object to make a request to an API endpoint"""
+            endpoint_url = '{0}/{1}'.format(cls._url_prefix, endpoint)
+            cacheable = endpoint not in cls.uncached_endpoints
+            def _function(self, id=None, **kwargs):
+                url = f'{endpoint_url}/{id}' if id else endpoint_url
+                return self.requester.request(url, http_method, kwargs, cacheable=cacheable)
+            function_name = endpoint.replace('/', '_')
+            _function.__name__ = str(function_name)
+            _function.__qualname__ = str('{0}.{1}'.format(cls.__qualname__, function_name))
+            _function.__doc__ = 'Tells the object to make a request to the {0} endpoint'.format(endpoint)
+            setattr(cls, function_name, _function)
+
         def __init__(self, requester):
             """Stores the request function for retrieving data"""
             self.requester = requester
@@ -208,28 +553,19 @@ class Untappd(object):
             """Tells the object to make a request if the endpoint base is callable"""
             if not self.is_callable:
                 error_message = 'Endpoint {0} is not callable'.format(self.__class__.__name__)
-                logging.error(error_message) # body is printed in warning above
+                _log.error(error_message) # body is printed in warning above
                 raise UntappdException(error_message)
-            endpoint_parts = (id,)
-            return self._make_request(endpoint_parts, 'GET', payload=kwargs)
-
-        def create_endpoint_function(self, endpoint=None):
-            """Dynamically creates a function to tell the object to make a request to an API endpoint"""
-            def _function(id=None, **kwargs):
-                http_method = 'POST' if endpoint in self.post_endpoints else 'GET'
-                endpoint_parts = (endpoint, id)
-                return self._make_request(endpoint_parts, http_method, payload=kwargs)
-            return _function
-
-        def _build_url(self, endpoint_parts):
-            """Builds the full API endpoint URL for the request"""
-            parts = ((API_URL_BASE, self.endpoint_base) + endpoint_parts)
-            return '/'.join(str(p) for p in parts if p)
-
-        def _make_request(self, endpoint_parts, http_method, payload=None):
-            """Uses the requester to make a request to an API endpoint"""
-            url = self._build_url(endpoint_parts)
-            return self.requester.request(url, http_method, payload)
+            url = f'{self._url_prefix}/{id}' if id else self._url_prefix
+            return self.requester.request(url, 'GET', kwargs)
+
+        def multi(self, endpoint, ids, max_workers=BULK_MAX_WORKERS, **kwargs):
+            """Requests an endpoint for several ids concurrently, e.g. client.beer.multi('info', beer_ids)"""
+            function = getattr(self, endpoint.replace('/', '_'))
+            return self.requester.bulk([(function, dict(kwargs, id=id)) for id in ids], max_workers)
+
+        def cache_clear(self):
+            """Empties the cached GET responses of this endpoint"""
+            self.requester.cache_clear(self._url_prefix)
 
     class Beer(_Endpoint):
         """Beer endpoint class"""
@@ -251,6 +587,7 @@ class Untappd(object):
         """Friend endpoint class"""
         endpoint_base = 'friend'
         get_endpoints = ('request', 'remove', 'accept', 'reject')
+        uncached_endpoints = get_endpoints
 
     class Notifications(_Endpoint):
         """Notifications endpoint class"""
@@ -281,8 +618,12 @@ class Untappd(object):
             'wishlist/add',
             'wishlist/delete'
         )
+        uncached_endpoints = ('wishlist/add', 'wishlist/delete')
 
     class Venue(_Endpoint):
         """Venue endpoint class"""
         endpoint_base = 'venue'
         get_endpoints = ('info', 'checkins', 'foursquare_lookup')
+
+    # Endpoints attached to every client, extend this when subclassing to add endpoints
+    _ENDPOINT_CLASSES = (Beer, Brewery, Checkin, Friend, Notifications, Search, ThePub, User, Venue)
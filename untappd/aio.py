@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# (c) 2013 Chris Betz
+"""Asyncio variant of the Untappd client, built on aiohttp"""
+import asyncio
+import logging
+
+import aiohttp
+
+from . import (
+    BULK_MAX_WORKERS,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    TOKEN_URL,
+    TRANSPORT_HTTP1,
+    NUM_REQUEST_TRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    Untappd,
+    UntappdException,
+    UntappdParseError,
+    json_loads,
+)
+
+_log = logging.getLogger(__name__)
+
+
+class AsyncUntappd(Untappd):
+    """Untappd V4 API client whose endpoint calls return awaitables"""
+
+    def __del__(self):
+        """Sessions must be closed from the event loop, see close()"""
+
+    async def close(self):
+        """Closes the underlying HTTP session"""
+        await self.requester.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    class OAuth(Untappd.OAuth):
+        """Handles OAuth authentication procedures and helps retrieve tokens"""
+        async def get_access_token(self, code):
+            """Gets the access token from a user's response"""
+            if not code:
+                error_message = 'Code not provided'
+                _log.error(error_message)
+                raise UntappdException(error_message)
+            access_token = self._get_cached_token(code)
+            if access_token is not None:
+                return access_token
+            payload = {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'response_type': 'code',
+                'redirect_url': self.redirect_url,
+                'code': str(code),
+            }
+            # Get the response from the token uri and attempt to parse
+            data = await self.requester.request(TOKEN_URL, payload=payload, enrich_payload=False, cacheable=False)
+            access_token = data.get('response').get('access_token')
+            self._cache_token(code, access_token)
+            return access_token
+
+    class Requester(Untappd.Requester):
+        """Asynchronous API requesting object"""
+        def __init__(self, client_id=None, client_secret=None, access_token=None, user_agent=None, cache_ttl=0, transport=TRANSPORT_HTTP1,
+                     request_tries=NUM_REQUEST_TRIES, retry_base_delay=RETRY_BASE_DELAY, retry_max_delay=RETRY_MAX_DELAY,
+                     connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT):
+            """Sets up the API requesting object"""
+            if transport != TRANSPORT_HTTP1:
+                error_message = 'The async client only supports the {0} transport'.format(TRANSPORT_HTTP1)
+                _log.error(error_message)
+                raise UntappdException(error_message)
+            self.client_id = client_id
+            self.client_secret = client_secret
+            self.headers = {}
+            if user_agent:
+                self.headers['User-Agent'] = user_agent
+            # The aiohttp session has to be created inside a running event loop
+            self._session = None
+            self._init_retries(request_tries, retry_base_delay, retry_max_delay)
+            self.connect_timeout = connect_timeout
+            self.read_timeout = read_timeout
+            self._init_cache(cache_ttl)
+            self._init_circuit()
+            self.set_access_token(access_token)
+
+        @property
+        def session(self):
+            """Lazily creates the shared aiohttp session"""
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, keepalive_timeout=30)
+                timeout = aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+                self._session = aiohttp.ClientSession(connector=connector, headers=self.headers, timeout=timeout)
+            return self._session
+
+        async def close(self):
+            """Closes the underlying HTTP session"""
+            if self._session is not None:
+                await self._session.close()
+
+        async def request(self, url, http_method='GET', payload=None, enrich_payload=True, cacheable=True):
+            """Tries to load data from an endpoint using retries"""
+            url, payload, cache_key = self._prepare_request(url, http_method, payload, enrich_payload, cacheable)
+            data = self._cache_get(cache_key)
+            if data is not None:
+                return data
+            for try_number in range(1, self.request_tries + 1):
+                try:
+                    self._check_circuit()
+                    data = await self._process_request(url, http_method, payload)
+                except UntappdException as e:
+                    await asyncio.sleep(self._failed_try(try_number, e))
+                else:
+                    return self._successful_try(cache_key, data)
+
+        async def bulk(self, calls, max_workers=BULK_MAX_WORKERS):
+            """Awaits (function, kwargs) pairs concurrently, at most max_workers at a time"""
+            semaphore = asyncio.Semaphore(max_workers)
+            async def _limited(function, kwargs):
+                async with semaphore:
+                    return await function(**kwargs)
+            return await asyncio.gather(*(_limited(function, kwargs) for function, kwargs in calls))
+
+        async def _process_request(self, url, http_method, payload):
+            """Makes the request and handles exception processing"""
+            try:
+                async with self.session.request(
+                    http_method,
+                    url,
+                    params=(payload or None) if http_method == 'GET' else None,
+                    data=payload if http_method == 'POST' else None,
+                ) as response:
+                    try:
+                        data = await self._decode_json_response(response)
+                        if response.status == 200:
+                            return data
+                        return self._check_response(data)
+                    except UntappdException as e:
+                        raise self._transient_error(e, response.status, response.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _log.error(e)
+                raise self._connection_error()
+
+        async def _decode_json_response(self, response):
+            """Decodes a json response"""
+            try:
+                return json_loads(await response.read())
+            except ValueError as e:
+                _log.error('Invalid response: %s', e)
+                raise UntappdParseError(e)